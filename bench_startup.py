@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+import statistics
+import tempfile
+
+# Each import runs in a fresh interpreter so every sample is a cold start.
+# The child runs in a throwaway directory with the repo on PYTHONPATH, so the
+# benchmark works from any cwd and importing process does not leave an
+# uploads/ folder behind.
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+MODULES = ['core', 'fetch', 'process']
+RUNS = 5
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+def time_import(module):
+    """Return the import time of a module in a new process, or None if it fails"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [REPO_DIR, env.get('PYTHONPATH')]))
+    with tempfile.TemporaryDirectory() as workdir:
+        result = subprocess.run(
+            [sys.executable, '-c', SNIPPET.format(module=module)],
+            capture_output=True, text=True, cwd=workdir, env=env
+        )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        print(f"{module}: import failed ({error[-1] if error else 'unknown error'})")
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+def main():
+    print(f"Cold-start import latency over {RUNS} runs")
+    print("-" * 30)
+    for module in MODULES:
+        samples = []
+        for _ in range(RUNS):
+            elapsed = time_import(module)
+            if elapsed is None:
+                break
+            samples.append(elapsed)
+        if samples:
+            print(f"{module}: median {statistics.median(samples) * 1000:.1f} ms, "
+                  f"min {min(samples) * 1000:.1f} ms")
+
+if __name__ == '__main__':
+    main()
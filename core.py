@@ -0,0 +1,102 @@
+from urllib.parse import urlparse
+
+# Kept free of pandas/requests/Flask so that it imports instantly; rows are
+# plain tuples in the column order of the uploaded sheet.
+
+WEBSITE_COLUMNS = ['website', 'Website', 'web', 'Web', 'url', 'URL', 'link', 'Link']
+
+SOCIAL_PLATFORMS = (
+    'youtube.com', 'youtu.be',
+    'facebook.com', 'fb.com',
+    'instagram.com',
+    'twitter.com', 'x.com',
+    'linkedin.com',
+    'tiktok.com',
+    'pinterest.com',
+    'snapchat.com',
+    'reddit.com',
+    'tumblr.com',
+    'medium.com',
+    'behance.net',
+    'dribbble.com',
+    'flickr.com',
+    'vimeo.com',
+    'soundcloud.com',
+    'spotify.com',
+    'wa.me',  # WhatsApp
+    'telegram.org',
+    'discord.com',
+    'twitch.tv',
+    'github.com',
+    'gitlab.com',
+    'bitbucket.org'
+)
+
+def normalize_url(url):
+    """
+    Normalize the URL by adding https:// if needed and removing trailing slashes
+    """
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    return url.rstrip('/')
+
+def get_domain(url):
+    """
+    Return the lowercased domain of a URL without the www. prefix
+    """
+    return urlparse(url.lower()).netloc.replace('www.', '')
+
+def is_social_platform(url):
+    """
+    Check if the URL is a social media or non-business platform
+    """
+    domain = get_domain(url)
+    return any(platform in domain for platform in SOCIAL_PLATFORMS)
+
+def is_same_domain(url1, url2):
+    """
+    Check if two URLs belong to the same domain
+    """
+    return get_domain(url1) == get_domain(url2)
+
+def find_website_column(columns):
+    """
+    Return the first column whose name looks like a website column, or None
+    """
+    for col in WEBSITE_COLUMNS:
+        if col in columns:
+            return col
+    return None
+
+def find_column_index(columns, name):
+    """
+    Return the index of the column whose header matches name as a string,
+    or None. Sheet headers may be ints or dates while form values are str.
+    """
+    for idx, column in enumerate(columns):
+        if str(column) == name:
+            return idx
+    return None
+
+def cell_to_url(value):
+    """
+    Turn a sheet cell into a stripped URL string, or '' if it is empty
+    """
+    if value is None or value != value:  # None or NaN
+        return ''
+    return str(value).strip()
+
+def separate_by_website(rows, column_index):
+    """
+    Split rows into those with a business website and those without one
+    (empty cell or a social platform link)
+    """
+    has_website = []
+    no_website = []
+    for row in rows:
+        url = cell_to_url(row[column_index])
+        if url and not is_social_platform(normalize_url(url)):
+            has_website.append(row)
+        else:
+            no_website.append(row)
+    return has_website, no_website
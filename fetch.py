@@ -1,12 +1,11 @@
-import pandas as pd
+import csv
 import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import os
+import re
+import json
+import sqlite3
 from datetime import datetime
 from urllib.parse import quote
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, NoSuchElementException
 import logging
 
 logging.basicConfig(
@@ -20,6 +19,23 @@ def clean_string(s):
         return ''
     return ''.join(filter(lambda x: x.isprintable(), str(s))).strip()
 
+CACHE_PATH = os.environ.get('SCRAPE_CACHE_PATH', 'scrape_cache.db')
+try:
+    CACHE_TTL_HOURS = float(os.environ.get('SCRAPE_CACHE_TTL_HOURS', '168'))
+except ValueError:
+    logging.warning("Invalid SCRAPE_CACHE_TTL_HOURS, using the default of 168 hours")
+    CACHE_TTL_HOURS = 168.0  # one week
+
+def load_selenium():
+    """Import the Selenium stack on first use so the CLI can prompt without waiting for it"""
+    global webdriver, By, WebDriverWait, EC
+    global StaleElementReferenceException, TimeoutException, NoSuchElementException
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, NoSuchElementException
+
 def get_user_input():
     """Get search parameters from user"""
     print("\nGoogle Maps Business Scraper")
@@ -32,9 +48,47 @@ def get_user_input():
         max_results = 100
     return location, niche, max_results
 
+class ResultCache:
+    """SQLite store of scraped places keyed by (search query, place id)"""
+
+    def __init__(self, path=CACHE_PATH, ttl_hours=CACHE_TTL_HOURS):
+        self.ttl = ttl_hours * 3600
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS places (
+                query TEXT NOT NULL,
+                place_id TEXT NOT NULL,
+                data TEXT NOT NULL,
+                scraped_at REAL NOT NULL,
+                PRIMARY KEY (query, place_id)
+            )"""
+        )
+        self.conn.commit()
+
+    def get_fresh(self, query, place_id):
+        """Return the stored info for a place if it was scraped within the TTL"""
+        row = self.conn.execute(
+            "SELECT data FROM places WHERE query = ? AND place_id = ? AND scraped_at >= ?",
+            (query, place_id, time.time() - self.ttl)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, query, place_id, info):
+        """Insert or refresh the stored info for a place"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO places (query, place_id, data, scraped_at) VALUES (?, ?, ?, ?)",
+            (query, place_id, json.dumps(info), time.time())
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
 class GoogleMapsScraper:
-    def __init__(self):
+    def __init__(self, cache=None):
         """Initialize the scraper with Chrome options"""
+        load_selenium()
+        self.cache = cache
         chrome_options = webdriver.ChromeOptions()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
@@ -50,6 +104,23 @@ class GoogleMapsScraper:
         search_query = quote(f"{query} in {location}")
         return f"https://www.google.com/maps/search/{search_query}"
 
+    def get_query_key(self, query, location):
+        """Cache key for a search, insensitive to case and surrounding whitespace"""
+        return self.generate_search_url(query.strip().lower(), location.strip().lower())
+
+    def get_place_id(self, result):
+        """Identify a result card without clicking it, using its place link"""
+        try:
+            link = result.find_element(By.CSS_SELECTOR, "a.hfpxzc")
+            href = link.get_attribute('href') or ''
+            match = re.search(r'!1s(0x[0-9a-f]+:0x[0-9a-f]+)', href)
+            if match:
+                return match.group(1)
+            # Never fall back to the name: branches of a chain would share one key
+            return href.split('?')[0]
+        except (NoSuchElementException, StaleElementReferenceException):
+            return ''
+
     def wait_for_results(self):
         """Wait for search results to load and become visible"""
         try:
@@ -206,14 +277,26 @@ class GoogleMapsScraper:
 
         self.scroll_results()
         results = self.find_results()
+        query_key = self.get_query_key(niche, location)
         data = []
+        cached = 0
         
         for i, result in enumerate(results[:max_results]):
+            place_id = self.get_place_id(result) if self.cache else ''
+            if place_id:
+                info = self.cache.get_fresh(query_key, place_id)
+                if info:
+                    data.append(info)
+                    cached += 1
+                    print(f"Cached {i + 1}/{max_results}: {info.get('name', 'N/A')}")
+                    continue
             for attempt in range(3):
                 try:
                     info = self.extract_business_info(result)
                     if info and any(info.values()):
                         data.append(info)
+                        if place_id:
+                            self.cache.put(query_key, place_id, info)
                         print(f"Scraped {i + 1}/{max_results}: {info.get('name', 'N/A')}")
                         break
                     time.sleep(2)
@@ -226,23 +309,30 @@ class GoogleMapsScraper:
             else:
                 print(f"Failed to extract info for {i + 1}/{max_results}")
 
+        if cached:
+            print(f"Reused {cached} cached results for this search")
         return data
 
     def close(self):
-        """Close the webdriver"""
+        """Close the webdriver and the result cache"""
         self.driver.quit()
+        if self.cache:
+            self.cache.close()
 
 if __name__ == '__main__':
     try:
         location, niche, max_results = get_user_input()
-        scraper = GoogleMapsScraper()
+        scraper = GoogleMapsScraper(cache=ResultCache())
         data = scraper.scrape(location, niche, max_results)
         
         if data:
-            df = pd.DataFrame(data)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f'business_data.csv'
-            df.to_csv(filename, index=False, encoding='utf-8')
+            fieldnames = list(dict.fromkeys(key for info in data for key in info))
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(data)
             print(f"\nSuccessfully scraped {len(data)} businesses")
             print(f"Data saved to {filename}")
         else:
@@ -1,6 +1,4 @@
-import pandas as pd
-import requests
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urljoin
 from concurrent.futures import ThreadPoolExecutor
 import time
 from flask import Flask, render_template, request, send_file, Response
@@ -9,6 +7,10 @@ from werkzeug.utils import secure_filename
 import queue
 import threading
 from math import ceil
+from core import (
+    normalize_url, get_domain, is_social_platform, is_same_domain,
+    find_website_column, find_column_index, separate_by_website
+)
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'uploads'
@@ -23,112 +25,44 @@ os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 def load_excel_data(file_path):
     """
-    Load data from Excel file and show available columns
+    Load data from Excel file and show available columns.
+    Returns (columns, rows) with rows as plain tuples and empty cells as None.
     """
     try:
+        import pandas as pd
         df = pd.read_excel(file_path)
         print("\nAvailable columns in your Excel file:")
         for idx, column in enumerate(df.columns):
             print(f"{idx}: {column}")
-        return df
+        df = df.astype(object).where(df.notna(), None)
+        return list(df.columns), list(df.itertuples(index=False, name=None))
     except Exception as e:
         print(f"Error loading Excel file: {e}")
-        return None
+        return None, None
 
-def get_website_column(df):
+def get_website_column(columns):
     """
     Try to automatically identify the website column or ask for user input
     """
-    website_columns = ['website', 'Website', 'web', 'Web', 'url', 'URL', 'link', 'Link']
-    
-    for col in website_columns:
-        if col in df.columns:
-            return col
+    website_column = find_website_column(columns)
+    if website_column is not None:
+        return website_column
     
     print("\nCouldn't automatically identify the website column.")
     print("Please enter the number of the column containing website URLs:")
-    for idx, column in enumerate(df.columns):
+    for idx, column in enumerate(columns):
         print(f"{idx}: {column}")
     
     while True:
         try:
             column_idx = int(input("Enter column number: "))
-            if 0 <= column_idx < len(df.columns):
-                return df.columns[column_idx]
+            if 0 <= column_idx < len(columns):
+                return columns[column_idx]
             else:
                 print("Invalid column number. Please try again.")
         except ValueError:
             print("Please enter a valid number.")
 
-def is_social_platform(url):
-    """
-    Check if the URL is a social media or non-business platform
-    """
-    social_platforms = [
-        'youtube.com', 'youtu.be',
-        'facebook.com', 'fb.com',
-        'instagram.com',
-        'twitter.com', 'x.com',
-        'linkedin.com',
-        'tiktok.com',
-        'pinterest.com',
-        'snapchat.com',
-        'reddit.com',
-        'tumblr.com',
-        'medium.com',
-        'behance.net',
-        'dribbble.com',
-        'flickr.com',
-        'vimeo.com',
-        'soundcloud.com',
-        'spotify.com',
-        'wa.me',  # WhatsApp
-        'telegram.org',
-        'discord.com',
-        'twitch.tv',
-        'github.com',
-        'gitlab.com',
-        'bitbucket.org'
-    ]
-    
-    parsed_url = urlparse(url.lower())
-    domain = parsed_url.netloc.replace('www.', '')
-    return any(platform in domain for platform in social_platforms)
-
-def separate_by_website(df, website_column):
-    """
-    Separate data into two dataframes based on website presence and validity
-    """
-    try:
-        # Create a mask for rows with non-empty website values
-        has_website_mask = df[website_column].notna() & (df[website_column].astype(str) != '')
-        
-        # Initialize DataFrames
-        has_website = pd.DataFrame()
-        no_website = pd.DataFrame()
-        
-        # Process each row to check for social platforms
-        for idx, row in df.iterrows():
-            url = str(row[website_column]).strip() if has_website_mask[idx] else ''
-            
-            if url and not is_social_platform(normalize_url(url)):
-                has_website = pd.concat([has_website, pd.DataFrame([row])], ignore_index=True)
-            else:
-                no_website = pd.concat([no_website, pd.DataFrame([row])], ignore_index=True)
-        
-        return has_website, no_website
-    except Exception as e:
-        print(f"Error separating data: {e}")
-        return pd.DataFrame(), pd.DataFrame()
-
-def normalize_url(url):
-    """
-    Normalize the URL by adding https:// if needed and removing trailing slashes
-    """
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-    return url.rstrip('/')
-
 def check_response(url, timeout=10):
     """
     Check if a URL returns a valid response
@@ -136,27 +70,20 @@ def check_response(url, timeout=10):
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
+    import requests
     try:
         response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
         return response.status_code == 200, response.url
     except:
         return False, None
 
-def is_same_domain(url1, url2):
-    """
-    Check if two URLs belong to the same domain
-    """
-    domain1 = urlparse(url1.lower()).netloc.replace('www.', '')
-    domain2 = urlparse(url2.lower()).netloc.replace('www.', '')
-    return domain1 == domain2
-
 def is_ecommerce_site(base_url):
     """
     Check if a website is an e-commerce site by looking for checkout pages
     """
     try:
         base_url = normalize_url(base_url)
-        original_domain = urlparse(base_url).netloc.replace('www.', '')
+        original_domain = get_domain(base_url)
         
         # First check if it's a social platform
         if is_social_platform(base_url):
@@ -201,6 +128,7 @@ def is_ecommerce_site(base_url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         try:
+            import requests
             response = requests.get(base_url, headers=headers, timeout=10)
             content = response.text.lower()
             
@@ -240,20 +168,20 @@ def is_ecommerce_site(base_url):
         print(f"Error checking website {base_url}: {e}")
         return False
 
-def process_websites(df_with_websites, website_column):
+def process_websites(rows_with_websites, column_index):
     """
-    Process websites and separate them into e-commerce and non-e-commerce
+    Process websites and separate them into e-commerce and non-e-commerce rows
     """
     ecommerce_sites = []
     normal_sites = []
-    total = len(df_with_websites)
+    total = len(rows_with_websites)
     app.config['total_websites'] = total
     app.config['processed_websites'] = 0
     
     log_message(f"Processing {total} websites...")
     
     def process_row(row):
-        url = row[website_column]
+        url = row[column_index]
         if isinstance(url, str) and url.strip():
             log_message(f"Checking: {url}")
             if is_ecommerce_site(url):
@@ -269,19 +197,24 @@ def process_websites(df_with_websites, website_column):
         log_message(f"PROGRESS:{progress}")
     
     with ThreadPoolExecutor(max_workers=5) as executor:
-        list(executor.map(process_row, df_with_websites.to_dict('records')))
+        list(executor.map(process_row, rows_with_websites))
     
-    return pd.DataFrame(ecommerce_sites), pd.DataFrame(normal_sites)
+    return ecommerce_sites, normal_sites
 
-def save_to_excel(no_website_df, normal_website_df, ecommerce_df, output_file):
+def save_to_excel(columns, no_website_rows, normal_website_rows, ecommerce_rows, output_file):
     """
-    Save the three dataframes to separate sheets in an Excel file
+    Save the three groups of rows to separate sheets in an Excel file
     """
     try:
+        import pandas as pd
+        sheets = [
+            ('No Website', no_website_rows),
+            ('Normal Website', normal_website_rows),
+            ('E-commerce Website', ecommerce_rows)
+        ]
         with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            no_website_df.to_excel(writer, sheet_name='No Website', index=False)
-            normal_website_df.to_excel(writer, sheet_name='Normal Website', index=False)
-            ecommerce_df.to_excel(writer, sheet_name='E-commerce Website', index=False)
+            for sheet_name, rows in sheets:
+                pd.DataFrame(rows, columns=columns).to_excel(writer, sheet_name=sheet_name, index=False)
         print(f"\nData successfully saved to {output_file}")
     except Exception as e:
         print(f"Error saving Excel file: {e}")
@@ -308,22 +241,17 @@ def upload_file():
             file.save(input_path)
             
             # Process the file
-            df = load_excel_data(input_path)
-            if df is None:
+            columns, rows = load_excel_data(input_path)
+            if columns is None:
                 return 'Error loading Excel file', 400
             
             # Try to automatically identify website column
-            website_columns = ['website', 'Website', 'web', 'Web', 'url', 'URL', 'link', 'Link']
-            website_column = None
-            for col in website_columns:
-                if col in df.columns:
-                    website_column = col
-                    break
+            website_column = find_website_column(columns)
             
             if website_column is None:
                 # If column not found, show column selection page
                 return render_template('select_column.html', 
-                                    columns=list(df.columns),
+                                    columns=columns,
                                     filename=filename)
             
             # Reset processing state
@@ -369,16 +297,19 @@ def start_processing():
     output_path = os.path.join(app.config['UPLOAD_FOLDER'], f'processed_{filename}')
     
     try:
-        df = load_excel_data(input_path)
-        if df is None:
+        columns, rows = load_excel_data(input_path)
+        if columns is None:
             return 'Error loading Excel file', 400
+        column_index = find_column_index(columns, website_column)
+        if column_index is None:
+            return f'Column not found: {website_column}', 400
         
         # Process the data
-        has_website_df, no_website_df = separate_by_website(df, website_column)
-        ecommerce_df, normal_website_df = process_websites(has_website_df, website_column)
+        has_website, no_website = separate_by_website(rows, column_index)
+        ecommerce, normal_website = process_websites(has_website, column_index)
         
         # Save results
-        save_to_excel(no_website_df, normal_website_df, ecommerce_df, output_path)
+        save_to_excel(columns, no_website, normal_website, ecommerce, output_path)
         
         app.config['processing_complete'].set()
         
@@ -410,16 +341,19 @@ def process_excel_file(input_path, website_column):
     """Helper function to process the Excel file with the selected column"""
     output_path = os.path.join(app.config['UPLOAD_FOLDER'], f'processed_{os.path.basename(input_path)}')
     
-    df = load_excel_data(input_path)
-    if df is None:
+    columns, rows = load_excel_data(input_path)
+    if columns is None:
         return 'Error loading Excel file', 400
+    column_index = find_column_index(columns, website_column)
+    if column_index is None:
+        return f'Column not found: {website_column}', 400
     
     # Process the data
-    has_website_df, no_website_df = separate_by_website(df, website_column)
-    ecommerce_df, normal_website_df = process_websites(has_website_df, website_column)
+    has_website, no_website = separate_by_website(rows, column_index)
+    ecommerce, normal_website = process_websites(has_website, column_index)
     
     # Save results
-    save_to_excel(no_website_df, normal_website_df, ecommerce_df, output_path)
+    save_to_excel(columns, no_website, normal_website, ecommerce, output_path)
     
     # Return the processed file
     return send_file(